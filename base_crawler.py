@@ -1,17 +1,147 @@
 from abc import ABC, abstractmethod
 from typing import List, Dict, Optional
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.lexbor import LexborHTMLParser
+import re
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from storage import url_fingerprint
+
+# HTML标签匹配，模块加载时编译一次
+_TAG_RE = re.compile(r'<[^>]+>')
+
+try:
+    import ahocorasick
+    _HAS_AHOCORASICK = True
+except ImportError:
+    _HAS_AHOCORASICK = False
+
+
+def make_keyword_matcher(keywords):
+    """构造关键词匹配函数
+
+    优先编译成Aho-Corasick自动机，一次扫描即可匹配全部关键词；
+    未安装pyahocorasick时回退到逐个子串判断。
+    """
+    keywords = tuple(keywords)
+    if _HAS_AHOCORASICK:
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+
+        def matcher(text: str) -> bool:
+            for _ in automaton.iter(text):
+                return True
+            return False
+    else:
+        def matcher(text: str) -> bool:
+            return any(keyword in text for keyword in keywords)
+    return matcher
+
+
+import functools
+import socket
+
+# 进程内缓存DNS解析结果：一次爬取会对同一主机发起上百次解析，
+# 缓存到会话生命周期即可，连接池掉线重连时也不再走解析器
+_orig_getaddrinfo = socket.getaddrinfo
+
+# 主机名到IP的覆盖表，由DNS复制解析（dns_utils.prewarm_dns）预热
+_DNS_OVERRIDES: Dict[str, str] = {}
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_cached(*args, **kwargs):
+    return _orig_getaddrinfo(*args, **kwargs)
+
+
+def _cached_getaddrinfo(host, *args, **kwargs):
+    host = _DNS_OVERRIDES.get(host, host)
+    return _resolve_cached(host, *args, **kwargs)
+
+
+def register_dns_override(host: str, address: str):
+    """登记主机名到IP的映射，之后对该主机的连接直接使用此IP"""
+    _DNS_OVERRIDES[host] = address
+
+
+def _install_dns_cache():
+    """用带LRU缓存的包装替换socket.getaddrinfo"""
+    if socket.getaddrinfo is not _cached_getaddrinfo:
+        socket.getaddrinfo = _cached_getaddrinfo
+
+
+_install_dns_cache()
+
+
+class RateLimiter:
+    """令牌桶式限速器：约束整体请求速率而非固定休眠
+
+    请求本身耗时超过速率预算时不再额外等待（固定sleep(1)做不到这点）。
+    线程安全，可供分页线程池内的并发请求共享。
+    """
+
+    def __init__(self, rate_per_sec: float = 2.0):
+        self.interval = 1.0 / rate_per_sec
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def acquire(self):
+        """阻塞到允许发起下一次请求为止"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_allowed - now
+            self._next_allowed = max(now, self._next_allowed) + self.interval
+        if wait > 0:
+            time.sleep(wait)
+
+
+try:
+    from requests_cache import CachedSession
+    _HAS_REQUESTS_CACHE = True
+except ImportError:
+    _HAS_REQUESTS_CACHE = False
+
+
+def _create_session() -> requests.Session:
+    """创建会话
+
+    安装requests-cache时启用带条件请求（ETag/If-Modified-Since）的本地
+    缓存，未变化的分页返回304且无需重新下载和解析；否则使用普通Session。
+    """
+    if _HAS_REQUESTS_CACHE:
+        return CachedSession('http_cache', backend='sqlite',
+                             expire_after=3600, cache_control=True)
+    return requests.Session()
+
+
+# 各爬虫类型共享一个Session，跨实例复用TCP/TLS连接池（keep-alive）
+_SHARED_SESSIONS: Dict[type, requests.Session] = {}
 
 
 class BaseCrawler(ABC):
     """爬虫基础抽象类"""
 
+    # 对单一站点的整体请求速率上限（次/秒），子类可覆盖
+    REQUESTS_PER_SEC = 2.0
+
     def __init__(self):
-        self.session = requests.Session()
-        self.setup_session()
+        self.rate_limiter = RateLimiter(rate_per_sec=self.REQUESTS_PER_SEC)
+        # 缓存基础URL，避免每个链接都做一次方法调用
+        self._base_url = self.get_base_url().rstrip('/')
+        session = _SHARED_SESSIONS.get(type(self))
+        if session is None:
+            # 首个实例负责创建并配置会话，后续实例直接复用
+            self.session = _create_session()
+            self.setup_session()
+            _SHARED_SESSIONS[type(self)] = self.session
+        else:
+            self.session = session
 
     def setup_session(self):
         """设置会话默认配置"""
@@ -24,28 +154,63 @@ class BaseCrawler(ABC):
             'Upgrade-Insecure-Requests': '1'
         })
 
-    def fetch_page(self, url: str, max_retries: int = 3) -> Optional[BeautifulSoup]:
-        """获取页面内容并解析为BeautifulSoup对象"""
-        for attempt in range(max_retries):
-            try:
-                response = self.session.get(url, timeout=30)
-                response.raise_for_status()
-                response.encoding = self.get_page_encoding(response)
-                return BeautifulSoup(response.text, 'html.parser')
-            except Exception as e:
-                logging.warning(f"第{attempt + 1}次获取页面失败: {url}, 错误: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
-                else:
-                    logging.error(f"获取页面最终失败: {url}")
-                    return None
-
-    def get_page_encoding(self, response) -> str:
-        """获取页面编码，子类可以重写"""
-        return 'utf-8'
+        # 重试交给urllib3处理（带退避），同时加大连接池避免socket被挤掉
+        retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[500, 502, 503, 504],
+            allowed_methods=['GET']
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def fetch_page(self, url: str) -> Optional[LexborHTMLParser]:
+        """获取页面内容并解析为LexborHTMLParser对象
+
+        重试由Session上挂载的HTTPAdapter/Retry完成，这里只处理最终失败。
+        """
+        tree, _ = self._fetch(url)
+        return tree
+
+    def _fetch(self, url: str):
+        """获取并解析页面，返回(解析树, 是否命中本地HTTP缓存)"""
+        try:
+            self.rate_limiter.acquire()
+            response = self.session.get(url, timeout=30)
+            response.raise_for_status()
+            from_cache = bool(getattr(response, 'from_cache', False))
+            encoding = self.get_page_encoding(response)
+            if encoding is None:
+                # 直接把字节交给Lexbor，省去一次全文解码和中间字符串
+                return LexborHTMLParser(response.content), from_cache
+            return LexborHTMLParser(response.content.decode(encoding, errors='replace')), from_cache
+        except Exception as e:
+            logging.error("获取页面最终失败: %s, 错误: %s", url, e)
+            return None, False
+
+    def get_page_encoding(self, response) -> Optional[str]:
+        """获取页面编码，子类可以重写
+
+        返回None表示把原始字节交给解析器自行探测（默认，最快）；
+        特殊站点可返回具体编码（如'gbk'）强制解码。
+        """
+        return None
+
+    # 非内容区域选择器，子类可按站点结构覆盖
+    NON_CONTENT_SELECTOR = 'nav, header, footer, script, style, noscript'
+
+    def strip_non_content(self, tree: LexborHTMLParser) -> None:
+        """剔除导航、页脚等非内容子树，减少后续遍历的节点数
+
+        Lexbor不支持只解析部分文档（类似bs4的SoupStrainer），
+        因此在全文档扫描前先剪掉明显无关的区域，效果等价。
+        """
+        for node in tree.css(self.NON_CONTENT_SELECTOR):
+            node.decompose()
 
     @abstractmethod
-    def extract_search_results(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def extract_search_results(self, tree: LexborHTMLParser) -> List[Dict[str, str]]:
         """从搜索结果页面提取标题和链接 - 子类必须实现"""
         pass
 
@@ -54,65 +219,118 @@ class BaseCrawler(ABC):
         """构造下一页URL - 子类必须实现"""
         pass
 
+    @classmethod
     @abstractmethod
-    def get_base_url(self) -> str:
-        """获取网站基础URL - 子类必须实现"""
+    def get_base_url(cls) -> str:
+        """获取网站基础URL - 子类必须实现（常量，无需实例）"""
         pass
 
     def normalize_url(self, href: str) -> str:
-        """规范化URL"""
-        from urllib.parse import urljoin
+        """规范化URL
 
-        if href.startswith('/'):
-            return urljoin(self.get_base_url(), href)
-        elif not href.startswith('http'):
-            return urljoin(self.get_base_url(), href)
-        else:
+        结果页里的链接绝大多数要么已是绝对地址、要么是站内路径，
+        用前缀判断直接拼接即可，省去每个链接一次urljoin解析。
+        """
+        if href.startswith(('http://', 'https://')):
             return href
+        if href.startswith('//'):
+            return 'https:' + href
+        if href.startswith('/'):
+            return self._base_url + href
+        return self._base_url + '/' + href
+
+    # 单个搜索URL内并发获取的分页窗口大小
+    PAGE_BATCH_SIZE = 4
+
+    def crawl_search_url(self, url: str, max_pages: int = 20,
+                         known_urls: Optional[set] = None) -> List[Dict[str, str]]:
+        """爬取单个搜索URL的所有结果
+
+        首页之后的分页按窗口并发获取（urllib3连接池是线程安全的），
+        窗口内出现空页或失败页即停止翻页。
 
-    def crawl_search_url(self, url: str, max_pages: int = 20) -> List[Dict[str, str]]:
-        """爬取单个搜索URL的所有结果"""
-        logging.info(f"开始爬取: {url}")
+        传入known_urls（已入库URL的64位指纹集合，见
+        DataStorage.get_known_urls）时，一旦某页出现已知结果即停止
+        翻页——结果按时间倒序，更深的页只会是更旧的已存数据。
+        """
+        logging.info("开始爬取: %s", url)
 
-        soup = self.fetch_page(url)
-        if not soup:
+        tree = self.fetch_page(url)
+        if not tree:
             return []
 
-        results = self.extract_search_results(soup)
+        results = self.extract_search_results(tree)
 
-        # 检查是否有分页，尝试获取更多页面
-        page_num = 0
-        while page_num < max_pages - 1:
-            next_page_url = self.build_next_page_url(url, page_num + 1)
-            if not next_page_url:
-                break
+        if known_urls and any(url_fingerprint(r['url']) in known_urls for r in results):
+            logging.info("首页已出现已知结果，跳过翻页")
+            return results
 
-            logging.info(f"获取第 {page_num + 2} 页")
-            next_soup = self.fetch_page(next_page_url)
-            if not next_soup:
-                break
+        # 检查是否有分页，按批次并发获取更多页面
+        page_num = 1
+        with ThreadPoolExecutor(max_workers=self.PAGE_BATCH_SIZE) as executor:
+            while page_num < max_pages:
+                batch_urls = []
+                for p in range(page_num, min(page_num + self.PAGE_BATCH_SIZE, max_pages)):
+                    next_page_url = self.build_next_page_url(url, p)
+                    if not next_page_url:
+                        break
+                    batch_urls.append(next_page_url)
 
-            next_results = self.extract_search_results(next_soup)
-            if not next_results:
-                break
+                if not batch_urls:
+                    break
 
-            results.extend(next_results)
-            page_num += 1
+                logging.info("并发获取第 %d - %d 页", page_num + 1, page_num + len(batch_urls))
+                batch_pages = list(executor.map(self._fetch, batch_urls))
 
-            time.sleep(1)  # 避免请求过快
+                stop = False
+                for next_tree, from_cache in batch_pages:
+                    if not next_tree:
+                        stop = True
+                        break
+
+                    next_results = self.extract_search_results(next_tree)
+                    if not next_results:
+                        stop = True
+                        break
+
+                    results.extend(next_results)
+
+                    if known_urls and any(url_fingerprint(r['url']) in known_urls
+                                          for r in next_results):
+                        # 已触及上次入库的数据，后续页都是旧数据
+                        logging.info("分页出现已知结果，提前停止翻页")
+                        stop = True
+                        break
+
+                    if from_cache:
+                        # 命中缓存说明该页自上次抓取后未变化，更深的页只会更旧，提前收尾
+                        logging.info("分页命中HTTP缓存，提前停止翻页")
+                        stop = True
+                        break
+
+                page_num += len(batch_urls)
+                if stop:
+                    break
 
         return results
 
+    @staticmethod
+    def _dedupe(results: List[Dict[str, str]]) -> List[Dict[str, str]]:
+        """按(标题, URL)去重，保持原有顺序"""
+        seen = {}
+        for result in results:
+            seen.setdefault((result['title'], result['url']), result)
+        return list(seen.values())
+
     def clean_title(self, title: str) -> str:
         """清理标题文本，移除HTML标签等"""
-        import re
         if title:
             # 移除HTML标签
-            title = re.sub(r'<[^>]+>', '', title)
-            title = title.strip()
+            title = _TAG_RE.sub('', title).strip()
         return title
 
+    @classmethod
     @abstractmethod
-    def get_crawler_name(self) -> str:
-        """获取爬虫名称 - 子类必须实现"""
+    def get_crawler_name(cls) -> str:
+        """获取爬虫名称 - 子类必须实现（常量，无需实例）"""
         pass
\ No newline at end of file
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+配置加载 - 全局唯一的配置读取入口
+"""
+import functools
+import json
+import logging
+import os
+
+try:
+    # C实现的解析器，比标准库json快数倍；未安装时回退到标准库
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+CONFIG_FILE = "urls_config.json"
+
+
+@functools.lru_cache(maxsize=1)
+def load_config(config_file: str = CONFIG_FILE):
+    """加载配置文件，进程内只解析一次（结果缓存）"""
+    if not os.path.exists(config_file):
+        logging.error(f"配置文件 {config_file} 不存在")
+        return None
+
+    try:
+        with open(config_file, 'rb') as f:
+            return _loads(f.read())
+    except Exception as e:
+        logging.error(f"加载配置文件失败: {e}")
+        return None
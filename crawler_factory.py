@@ -42,9 +42,10 @@ class CrawlerFactory:
         if crawler_type not in cls._crawlers:
             return {}
 
-        crawler = cls.create_crawler(crawler_type)
+        # 名称和基础URL都是类级常量，无需实例化（实例化会创建Session等）
+        crawler_class = cls._crawlers[crawler_type]
         return {
             'type': crawler_type,
-            'name': crawler.get_crawler_name(),
-            'base_url': crawler.get_base_url()
+            'name': crawler_class.get_crawler_name(),
+            'base_url': crawler_class.get_base_url()
         }
\ No newline at end of file
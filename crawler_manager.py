@@ -3,27 +3,71 @@
 爬虫管理器 - 核心业务逻辑
 """
 import logging
-import json
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Dict, List
+from config import load_config
 from crawler_factory import CrawlerFactory
 from storage import DataStorage
 
 
-def load_config():
-    """加载配置文件"""
-    config_file = "urls_config.json"
-    if not os.path.exists(config_file):
-        logging.error(f"配置文件 {config_file} 不存在")
-        return None
+def _process_config(url_config: Dict, storage: DataStorage, crawler_settings: Dict,
+                    crawlers: Dict, crawlers_lock: threading.Lock) -> Dict:
+    """爬取单个搜索配置并保存数据，返回本配置的运行结果"""
+    key = url_config['key']
+    name = url_config['name']
+    url = url_config['url']
+    crawler_type = url_config['crawler_type']
+
+    logging.info("开始处理配置 [%s] %s (类型: %s)", key, name, crawler_type)
+    logging.info("URL: %s", url)
+
+    # 记录本配置的结果
+    config_result = {
+        'key': key,
+        'name': name,
+        'url': url,
+        'crawler_type': crawler_type,
+        'crawled_count': 0,
+        'new_count': 0,
+        'total_count': 0,
+        'new_items': [],
+        'error': None
+    }
 
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        # 创建（或复用）对应类型的爬虫
+        with crawlers_lock:
+            crawler = crawlers.get(crawler_type)
+            if crawler is None:
+                crawler = CrawlerFactory.create_crawler(crawler_type)
+                crawlers[crawler_type] = crawler
+
+        # 爬取数据，带上已入库URL集合以便增量运行时提前停止翻页
+        max_pages = crawler_settings.get('max_pages', 20)
+        known_urls = storage.get_known_urls(url, source_name=name)
+        results = crawler.crawl_search_url(url, max_pages, known_urls=known_urls)
+        logging.info("[%s] 爬取到 %d 个结果", key, len(results))
+        config_result['crawled_count'] = len(results)
+
+        if results:
+            # 保存数据并获取新增项
+            total_count, new_items = storage.save_data(url, results, source_key=key, source_name=name)
+
+            # 记录到config_result
+            config_result['new_count'] = len(new_items)
+            config_result['total_count'] = total_count
+            config_result['new_items'] = new_items
+        else:
+            logging.warning("[%s] 未能获取到任何结果", key)
+
     except Exception as e:
-        logging.error(f"加载配置文件失败: {e}")
-        return None
+        logging.error("处理URL时发生错误: %s", e)
+        config_result['error'] = str(e)
+
+    return config_result
 
 
 def run_crawler(generate_report: bool = True):
@@ -70,81 +114,50 @@ def run_crawler(generate_report: bool = True):
     storage = DataStorage()
     crawler_settings = config.get('crawler_settings', {})
 
+    # 可选：对配置中的主机做DNS复制解析，削减解析尾延迟
+    if crawler_settings.get('dns_replication', False):
+        from dns_utils import prewarm_dns
+        prewarm_dns([url_config['url'] for url_config in search_urls])
+
     total_new_items = 0
     total_all_items = 0
     run_results = []  # 收集每个配置的运行结果
-
-    # 处理每个搜索URL
-    for i, url_config in enumerate(search_urls, 1):
-        key = url_config['key']
-        name = url_config['name']
-        url = url_config['url']
-        crawler_type = url_config['crawler_type']
-
-        logging.info(f"\n处理第 {i}/{len(search_urls)} 个搜索配置...")
-        logging.info(f"配置Key: {key}")
-        logging.info(f"配置名称: {name}")
-        logging.info(f"爬虫类型: {crawler_type}")
-        logging.info(f"URL: {url}")
-
-        # 记录本配置的结果
-        config_result = {
-            'key': key,
-            'name': name,
-            'url': url,
-            'crawler_type': crawler_type,
-            'crawled_count': 0,
-            'new_count': 0,
-            'total_count': 0,
-            'new_items': [],
-            'error': None
+    crawlers = {}  # 按类型缓存爬虫实例，避免重复创建
+    crawlers_lock = threading.Lock()
+
+    # 各配置相互独立且以网络等待为主，用线程池并发处理
+    concurrency = crawler_settings.get('concurrency', 8)
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {
+            executor.submit(_process_config, url_config, storage,
+                            crawler_settings, crawlers, crawlers_lock): url_config
+            for url_config in search_urls
         }
 
-        try:
-            # 创建对应类型的爬虫
-            crawler = CrawlerFactory.create_crawler(crawler_type)
-
-            # 爬取数据
-            max_pages = crawler_settings.get('max_pages', 20)
-            results = crawler.crawl_search_url(url, max_pages)
-            logging.info(f"爬取到 {len(results)} 个结果")
-            config_result['crawled_count'] = len(results)
-
-            if results:
-                # 保存数据并获取新增项
-                all_items, new_items = storage.save_data(url, results, source_key=key, source_name=name)
-                total_all_items += len(all_items)
-                total_new_items += len(new_items)
-
-                # 记录到config_result
-                config_result['new_count'] = len(new_items)
-                config_result['total_count'] = len(all_items)
-                config_result['new_items'] = new_items
-
-                if new_items:
-                    logging.info(f"发现 {len(new_items)} 个新项目:")
-                    for item in new_items[:5]:  # 只显示前5个
-                        logging.info(f"  - {item['title']}")
-                    if len(new_items) > 5:
-                        logging.info(f"  ... 还有 {len(new_items) - 5} 个新项目")
-                else:
-                    logging.info("没有发现新项目")
-
-                # 显示数据摘要
-                summary = storage.get_summary(url, source_name=name)
-                logging.info(f"数据摘要: 总计 {summary['total_items']} 项，"
-                           f"最后更新: {summary['last_updated']}")
-
+        for i, future in enumerate(as_completed(futures), 1):
+            config_result = future.result()
+            logging.info("\n完成第 %d/%d 个搜索配置: [%s] %s", i, len(search_urls),
+                         config_result['key'], config_result['name'])
+
+            total_all_items += config_result['total_count']
+            total_new_items += config_result['new_count']
+
+            new_items = config_result['new_items']
+            if new_items:
+                logging.info("发现 %d 个新项目:", len(new_items))
+                for item in new_items[:5]:  # 只显示前5个
+                    logging.info("  - %s", item['title'])
+                if len(new_items) > 5:
+                    logging.info("  ... 还有 %d 个新项目", len(new_items) - 5)
             else:
-                logging.warning("未能获取到任何结果")
+                logging.info("没有发现新项目")
 
-        except Exception as e:
-            logging.error(f"处理URL时发生错误: {str(e)}")
-            config_result['error'] = str(e)
+            run_results.append(config_result)
+            logging.info("-" * 60)
 
-        # 添加到运行结果列表
-        run_results.append(config_result)
-        logging.info("-" * 60)
+    # 按配置顺序排列结果，保证报告顺序稳定
+    config_order = {uc['key']: i for i, uc in enumerate(search_urls)}
+    run_results.sort(key=lambda r: config_order.get(r['key'], len(config_order)))
 
     # 总结
     end_time = datetime.now()
@@ -181,15 +194,15 @@ def run_crawler(generate_report: bool = True):
         logging.info(f"\n报告已生成: {report_path}")
 
 
-def generate_markdown_report(run_result: Dict) -> str:
+def iter_markdown_report(run_result: Dict):
     """
-    生成Markdown格式的运行报告
+    逐行生成Markdown格式的运行报告
 
     Args:
         run_result: 运行结果字典，包含所有配置的爬取结果
 
-    Returns:
-        Markdown格式的报告内容
+    Yields:
+        报告的每一行（不含换行符）
     """
     start_time = run_result.get('start_time', datetime.now())
     end_time = run_result.get('end_time', datetime.now())
@@ -199,43 +212,45 @@ def generate_markdown_report(run_result: Dict) -> str:
     results = run_result.get('results', [])
 
     # 生成报告
-    lines = []
-    lines.append(f"# 爬虫运行报告")
-    lines.append(f"")
-    lines.append(f"**运行时间**: {start_time.strftime('%Y-%m-%d %H:%M:%S')} - {end_time.strftime('%H:%M:%S')}")
-    lines.append(f"**处理配置**: {total_configs} 个")
-    lines.append(f"**总计数据项**: {total_all_items}")
-    lines.append(f"**本次新增**: {total_new_items}")
-    lines.append(f"")
-    lines.append(f"---")
-    lines.append(f"")
+    yield f"# 爬虫运行报告"
+    yield f""
+    yield f"**运行时间**: {start_time.strftime('%Y-%m-%d %H:%M:%S')} - {end_time.strftime('%H:%M:%S')}"
+    yield f"**处理配置**: {total_configs} 个"
+    yield f"**总计数据项**: {total_all_items}"
+    yield f"**本次新增**: {total_new_items}"
+    yield f""
+    yield f"---"
+    yield f""
 
     # 逐个配置的详细结果
     for i, result in enumerate(results, 1):
-        lines.append(f"## {i}. {result['name']} ({result['key']})")
-        lines.append(f"")
-        lines.append(f"- **URL**: {result['url']}")
-        lines.append(f"- **爬虫类型**: {result['crawler_type']}")
-        lines.append(f"- **爬取结果数**: {result['crawled_count']}")
-        lines.append(f"- **新增数量**: {result['new_count']}")
-        lines.append(f"- **总计数据项**: {result['total_count']}")
-        lines.append(f"")
+        yield f"## {i}. {result['name']} ({result['key']})"
+        yield f""
+        yield f"- **URL**: {result['url']}"
+        yield f"- **爬虫类型**: {result['crawler_type']}"
+        yield f"- **爬取结果数**: {result['crawled_count']}"
+        yield f"- **新增数量**: {result['new_count']}"
+        yield f"- **总计数据项**: {result['total_count']}"
+        yield f""
 
         # 显示新增项目
         if result['new_items']:
-            lines.append(f"### 本次新增项目 ({len(result['new_items'])} 项)")
-            lines.append(f"")
+            yield f"### 本次新增项目 ({len(result['new_items'])} 项)"
+            yield f""
             for j, item in enumerate(result['new_items'], 1):
-                lines.append(f"{j}. [{item['title']}]({item['url']})")
-            lines.append(f"")
+                yield f"{j}. [{item['title']}]({item['url']})"
+            yield f""
         else:
-            lines.append(f"*本次运行未发现新项目*")
-            lines.append(f"")
+            yield f"*本次运行未发现新项目*"
+            yield f""
 
-        lines.append(f"---")
-        lines.append(f"")
+        yield f"---"
+        yield f""
 
-    return "\n".join(lines)
+
+def generate_markdown_report(run_result: Dict) -> str:
+    """生成完整的Markdown报告字符串（便于测试或直接展示）"""
+    return "\n".join(iter_markdown_report(run_result))
 
 
 def save_markdown_report(run_result: Dict, output_dir: str = "result") -> str:
@@ -258,10 +273,10 @@ def save_markdown_report(run_result: Dict, output_dir: str = "result") -> str:
     filename = f"result_{timestamp}.md"
     filepath = os.path.join(output_dir, filename)
 
-    # 生成并保存报告
-    report_content = generate_markdown_report(run_result)
-    with open(filepath, 'w', encoding='utf-8') as f:
-        f.write(report_content)
+    # 逐行流式写出，避免整份报告先拼成一个大字符串
+    with open(filepath, 'wb') as f:
+        f.writelines(line.encode('utf-8') + b'\n'
+                     for line in iter_markdown_report(run_result))
 
     logging.info(f"已保存运行报告: {filepath}")
     return filepath
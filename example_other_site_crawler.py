@@ -1,7 +1,18 @@
+import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import logging
-from base_crawler import BaseCrawler
+from base_crawler import BaseCrawler, make_keyword_matcher
+
+# 分页参数匹配，模块加载时编译一次
+_PAGE_RE = re.compile(r'page=\d+')
+_P_RE = re.compile(r'p=\d+')
+
+# 无效链接/导航文本关键词，编译为一次扫描的匹配器
+_INVALID_HREF_KEYWORDS = ('javascript', '#', 'mailto')
+_INVALID_TITLE_KEYWORDS = ('首页', '返回', '上一页', '下一页', '更多', '导航')
+_has_invalid_href = make_keyword_matcher(_INVALID_HREF_KEYWORDS)
+_has_invalid_title = make_keyword_matcher(_INVALID_TITLE_KEYWORDS)
 
 
 class ExampleOtherSiteCrawler(BaseCrawler):
@@ -10,10 +21,12 @@ class ExampleOtherSiteCrawler(BaseCrawler):
     这是一个示例实现，展示如何为其他网站创建爬虫
     """
 
-    def get_base_url(self) -> str:
+    @classmethod
+    def get_base_url(cls) -> str:
         return 'https://example.gov.cn'
 
-    def get_crawler_name(self) -> str:
+    @classmethod
+    def get_crawler_name(cls) -> str:
         return 'example_other_site'
 
     def get_page_encoding(self, response) -> str:
@@ -21,7 +34,7 @@ class ExampleOtherSiteCrawler(BaseCrawler):
         # 某些网站可能使用不同的编码
         return 'gbk'  # 或其他编码
 
-    def extract_search_results(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def extract_search_results(self, tree: LexborHTMLParser) -> List[Dict[str, str]]:
         """从其他网站搜索结果页面提取标题和链接"""
         results = []
 
@@ -29,17 +42,18 @@ class ExampleOtherSiteCrawler(BaseCrawler):
         # 这里展示一个通用的提取方法
 
         # 方法1: 查找特定的结果容器
-        result_containers = soup.select('.result-item, .search-result, .content-item')
+        result_containers = tree.css('.result-item, .search-result, .content-item')
 
         if result_containers:
-            logging.info(f"找到 {len(result_containers)} 个搜索结果容器")
+            logging.info("找到 %d 个搜索结果容器", len(result_containers))
 
             for container in result_containers:
                 # 查找标题链接
-                title_link = container.find('a', href=True)
-                if title_link:
-                    href = title_link.get('href', '')
-                    title = title_link.get('title') or title_link.get_text().strip()
+                title_link = container.css_first('a[href]')
+                if title_link is not None:
+                    href = title_link.attributes.get('href') or ''
+                    # title属性直接可用时跳过子树文本拼接
+                    title = title_link.attributes.get('title') or title_link.text(strip=True)
 
                     # 清理标题
                     title = self.clean_title(title)
@@ -54,11 +68,11 @@ class ExampleOtherSiteCrawler(BaseCrawler):
         # 方法2: 如果没有找到特定容器，尝试通用方法
         if not results:
             logging.info("未找到特定容器，尝试通用链接提取")
-            links = soup.find_all('a', href=True)
-
-            for link in links:
-                href = link.get('href', '')
-                title = link.get('title') or link.get_text().strip()
+            self.strip_non_content(tree)
+            for link in tree.css('a[href]'):
+                href = link.attributes.get('href') or ''
+                # deep=False避免对每个<a>做递归文本拼接
+                title = link.attributes.get('title') or link.text(deep=False, strip=True)
 
                 if self._is_valid_result(title, href):
                     full_url = self.normalize_url(href)
@@ -68,8 +82,8 @@ class ExampleOtherSiteCrawler(BaseCrawler):
                     })
 
         # 去重
-        unique_results = self._deduplicate_results(results)
-        logging.info(f"提取到 {len(unique_results)} 个唯一结果")
+        unique_results = self._dedupe(results)
+        logging.info("提取到 %d 个唯一结果", len(unique_results))
         return unique_results
 
     def _is_valid_result(self, title: str, href: str) -> bool:
@@ -78,16 +92,12 @@ class ExampleOtherSiteCrawler(BaseCrawler):
             return False
 
         # 过滤掉无效链接
-        invalid_keywords = ['javascript', '#', 'mailto']
-        for keyword in invalid_keywords:
-            if keyword in href.lower():
-                return False
+        if _has_invalid_href(href.lower()):
+            return False
 
         # 过滤掉导航文本
-        invalid_titles = ['首页', '返回', '上一页', '下一页', '更多', '导航']
-        for keyword in invalid_titles:
-            if keyword in title:
-                return False
+        if _has_invalid_title(title):
+            return False
 
         # 检查是否为内容页面（根据具体网站调整）
         if any(pattern in href for pattern in ['/article/', '/news/', '/detail/', '.html']):
@@ -95,29 +105,16 @@ class ExampleOtherSiteCrawler(BaseCrawler):
 
         return False
 
-    def _deduplicate_results(self, results: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """去重"""
-        seen = set()
-        unique_results = []
-        for result in results:
-            identifier = (result['title'], result['url'])
-            if identifier not in seen:
-                seen.add(identifier)
-                unique_results.append(result)
-        return unique_results
-
     def build_next_page_url(self, base_url: str, page_num: int) -> Optional[str]:
         """构造下一页URL - 根据具体网站的分页方式实现"""
 
         # 示例1: 使用page参数
         if 'page=' in base_url:
-            import re
-            return re.sub(r'page=\d+', f'page={page_num}', base_url)
+            return _PAGE_RE.sub(f'page={page_num}', base_url)
 
         # 示例2: 使用p参数
         elif 'p=' in base_url:
-            import re
-            return re.sub(r'p=\d+', f'p={page_num}', base_url)
+            return _P_RE.sub(f'p={page_num}', base_url)
 
         # 示例3: 添加页码参数
         else:
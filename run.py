@@ -4,6 +4,7 @@
 """
 import argparse
 import logging
+import logging.handlers
 import sys
 from crawler_manager import run_crawler
 from storage import DataStorage
@@ -11,11 +12,21 @@ from storage import DataStorage
 
 def setup_logging():
     """设置日志"""
+    # 文件日志经内存缓冲批量落盘，WARNING及以上立即刷新；
+    # 避免每条INFO都触发一次磁盘写
+    file_handler = logging.FileHandler('crawler.log', encoding='utf-8')
+    # MemoryHandler刷新时由target负责格式化，basicConfig的format
+    # 只会设到MemoryHandler上，须在target上显式设置
+    file_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1000, flushLevel=logging.WARNING, target=file_handler)
+
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler('crawler.log', encoding='utf-8'),
+            buffered_handler,
             logging.StreamHandler(sys.stdout)
         ]
     )
@@ -1,34 +1,46 @@
+import re
 from typing import List, Dict, Optional
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser
 import logging
-from base_crawler import BaseCrawler
+from base_crawler import BaseCrawler, make_keyword_matcher
+
+# 分页参数匹配，模块加载时编译一次
+_PAGENUM_RE = re.compile(r'pageNum=\d+')
+
+# 无效链接/导航文本关键词，编译为一次扫描的匹配器
+_INVALID_HREF_KEYWORDS = ('javascript', '#', 'mailto')
+_INVALID_TITLE_KEYWORDS = ('首页', '返回', '上一页', '下一页', '更多', '导航', '搜索')
+_has_invalid_href = make_keyword_matcher(_INVALID_HREF_KEYWORDS)
+_has_invalid_title = make_keyword_matcher(_INVALID_TITLE_KEYWORDS)
 
 
 class SichuanFGWCrawler(BaseCrawler):
     """四川省发改委网站爬虫实现"""
 
-    def get_base_url(self) -> str:
+    @classmethod
+    def get_base_url(cls) -> str:
         return 'https://fgw.sc.gov.cn'
 
-    def get_crawler_name(self) -> str:
+    @classmethod
+    def get_crawler_name(cls) -> str:
         return 'sichuan_fgw'
 
-    def extract_search_results(self, soup: BeautifulSoup) -> List[Dict[str, str]]:
+    def extract_search_results(self, tree: LexborHTMLParser) -> List[Dict[str, str]]:
         """从四川省发改委搜索结果页面提取标题和链接"""
         results = []
 
         # 查找搜索结果容器
-        result_items = soup.select('.wordGuide')
+        result_items = tree.css('.wordGuide')
         if result_items:
-            logging.info(f"找到 {len(result_items)} 个搜索结果项")
+            logging.info("找到 %d 个搜索结果项", len(result_items))
 
             for item in result_items:
                 # 查找标题链接
-                title_link = item.select('.bigTit a')
-                if title_link:
-                    link_elem = title_link[0]
-                    href = link_elem.get('href', '')
-                    title = link_elem.get('title') or link_elem.get_text().strip()
+                link_elem = item.css_first('.bigTit a')
+                if link_elem is not None:
+                    href = link_elem.attributes.get('href') or ''
+                    # title属性直接可用时跳过子树文本拼接
+                    title = link_elem.attributes.get('title') or link_elem.text(strip=True)
 
                     # 清理标题（移除HTML标签）
                     title = self.clean_title(title)
@@ -43,10 +55,11 @@ class SichuanFGWCrawler(BaseCrawler):
         # 如果没有找到.wordGuide容器，尝试查找所有相关链接
         if not results:
             logging.info("未找到.wordGuide容器，尝试提取所有相关链接")
-            links = soup.find_all('a', href=True)
-            for link in links:
-                href = link.get('href', '')
-                title = link.get('title') or link.get_text().strip()
+            self.strip_non_content(tree)
+            for link in tree.css('a[href]'):
+                href = link.attributes.get('href') or ''
+                # deep=False避免对每个<a>做递归文本拼接
+                title = link.attributes.get('title') or link.text(deep=False, strip=True)
 
                 # 过滤掉导航链接和无效链接
                 if self._is_valid_result_link(title, href):
@@ -57,8 +70,8 @@ class SichuanFGWCrawler(BaseCrawler):
                     })
 
         # 去重
-        unique_results = self._deduplicate_results(results)
-        logging.info(f"提取到 {len(unique_results)} 个唯一结果")
+        unique_results = self._dedupe(results)
+        logging.info("提取到 %d 个唯一结果", len(unique_results))
         return unique_results
 
     def _is_valid_result_link(self, title: str, href: str) -> bool:
@@ -67,16 +80,12 @@ class SichuanFGWCrawler(BaseCrawler):
             return False
 
         # 过滤掉导航链接和无效链接
-        invalid_keywords = ['javascript', '#', 'mailto']
-        for keyword in invalid_keywords:
-            if keyword in href.lower():
-                return False
+        if _has_invalid_href(href.lower()):
+            return False
 
         # 过滤掉导航文本
-        invalid_titles = ['首页', '返回', '上一页', '下一页', '更多', '导航', '搜索']
-        for keyword in invalid_titles:
-            if keyword in title:
-                return False
+        if _has_invalid_title(title):
+            return False
 
         # 检查是否为内容页面
         if '.shtml' in href or 'detail' in href:
@@ -84,23 +93,11 @@ class SichuanFGWCrawler(BaseCrawler):
 
         return False
 
-    def _deduplicate_results(self, results: List[Dict[str, str]]) -> List[Dict[str, str]]:
-        """去重"""
-        seen = set()
-        unique_results = []
-        for result in results:
-            identifier = (result['title'], result['url'])
-            if identifier not in seen:
-                seen.add(identifier)
-                unique_results.append(result)
-        return unique_results
-
     def build_next_page_url(self, base_url: str, page_num: int) -> Optional[str]:
         """构造四川省发改委网站的下一页URL"""
         if 'pageNum=' in base_url:
             # 替换pageNum参数
-            import re
-            return re.sub(r'pageNum=\d+', f'pageNum={page_num}', base_url)
+            return _PAGENUM_RE.sub(f'pageNum={page_num}', base_url)
         else:
             # 添加pageNum参数
             separator = '&' if '?' in base_url else '?'
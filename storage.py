@@ -1,16 +1,206 @@
+import functools
 import json
 import os
 import hashlib
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Tuple
 import logging
 
+try:
+    # C实现的序列化器，比标准库json快数倍且直接产出字节串
+    import orjson
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+try:
+    # 文件名哈希无需密码学强度，xxhash比md5快数倍
+    import xxhash
+    _HAS_XXHASH = True
+except ImportError:
+    _HAS_XXHASH = False
+
+try:
+    # 流式JSON解析器，读摘要时无需加载整个items数组
+    import ijson
+    _HAS_IJSON = True
+except ImportError:
+    _HAS_IJSON = False
+
+try:
+    # 次选的C实现JSON编解码器，orjson缺席时顶上（仍远快于标准库）
+    import msgspec.json
+    _HAS_MSGSPEC = True
+except ImportError:
+    _HAS_MSGSPEC = False
+
+try:
+    # 大批量保存时用C层向量化做成员判断
+    import numpy
+    _HAS_NUMPY = True
+except ImportError:
+    _HAS_NUMPY = False
+
+# 低于该批量时向量化的固定开销得不偿失，走普通推导式
+_VECTORIZE_THRESHOLD = 500
+
+
+def _filter_new_items(results: List[Dict[str, str]], url_index: set) -> List[Dict[str, str]]:
+    """筛出URL不在索引中的新条目
+
+    批量足够大且安装了numpy时，用numpy.isin一次C循环完成全部
+    成员判断；否则逐条查集合。
+    """
+    if _HAS_NUMPY and len(results) >= _VECTORIZE_THRESHOLD:
+        urls = numpy.fromiter((item['url'] for item in results),
+                              dtype=object, count=len(results))
+        existing = numpy.fromiter(url_index, dtype=object, count=len(url_index))
+        mask = ~numpy.isin(urls, existing)
+        return [results[i] for i in numpy.nonzero(mask)[0]]
+    return [item for item in results if item['url'] not in url_index]
+
+# 文件读写使用1MiB缓冲，减少大文件场景下的系统调用次数
+_IO_BUFFER_SIZE = 1 << 20
+
+# 文件名非法字符，模块加载时编译一次
+_SANITIZE_RE = re.compile(r'[^\w\u4e00-\u9fff\-_]')
+
+
+@functools.lru_cache(maxsize=2048)
+def _sanitized_name(source_name: str) -> str:
+    """清理数据源名称中的特殊字符（结果确定，放心缓存）"""
+    return _SANITIZE_RE.sub('_', source_name)
+
+
+def _name_on_disk(data_dir: str, name: str) -> bool:
+    """判断某文件名下是否已有落盘数据（新旧两种布局都算）"""
+    return any(os.path.exists(os.path.join(data_dir, name + suffix))
+               for suffix in ('.meta.json', '.items.jsonl', '.json'))
+
+
+@functools.lru_cache(maxsize=2048)
+def _url_hash_name(data_dir: str, url: str) -> str:
+    """URL哈希文件名（无source_name时的兼容路径）
+
+    优先使用xxhash；已存在md5命名的数据文件（任一布局）时沿用
+    旧名，避免换哈希后找不到历史数据。
+    """
+    encoded = url.encode('utf-8')
+    if _HAS_XXHASH:
+        name = xxhash.xxh3_128_hexdigest(encoded)
+        if not _name_on_disk(data_dir, name):
+            legacy = hashlib.md5(encoded).hexdigest()
+            if _name_on_disk(data_dir, legacy):
+                return legacy
+        return name
+    return hashlib.md5(encoded).hexdigest()
+
+
+def _json_loads(data: bytes):
+    """反序列化JSON字节串，按orjson、msgspec、标准库的顺序择优"""
+    if _HAS_ORJSON:
+        return orjson.loads(data)
+    if _HAS_MSGSPEC:
+        return msgspec.json.decode(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> bytes:
+    """序列化为JSON字节串（UTF-8，中文不转义）
+
+    落盘文件全部走紧凑格式——这些文件只被机器读写，缩进徒增
+    近一倍的体积和序列化开销；偶尔需要人读时用jq等工具排版。
+    """
+    if _HAS_ORJSON:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+    if _HAS_MSGSPEC:
+        encoded = msgspec.json.encode(obj)
+        return msgspec.json.format(encoded, indent=2) if indent else encoded
+    return json.dumps(obj, ensure_ascii=False,
+                      indent=2 if indent else None).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=256)
+def _parsed_file(path: str, mtime_ns: int, size: int):
+    """按(路径, mtime, 大小)为键缓存的JSON文件解析
+
+    文件被重写后mtime变化、键随之不同，旧缓存条目自然失效，
+    无需显式清理；保存后紧接着的摘要读取可直接命中。
+    """
+    with open(path, 'rb') as f:
+        return _json_loads(f.read())
+
+
+def _load_json_cached(path: str):
+    """读取并解析JSON文件，未变化时复用上次的解析结果"""
+    st = os.stat(path)
+    return _parsed_file(path, st.st_mtime_ns, st.st_size)
+
+
+def _atomic_write(path: str, payload: bytes):
+    """整体重写文件：先写临时文件，落盘后os.replace原子替换
+
+    进程在写入中途崩溃时旧文件完好，读取方不会碰到截断的半成品；
+    fsync一次即可，替换本身由文件系统保证原子。
+    """
+    tmp = path + '.tmp'
+    with open(tmp, 'wb', buffering=_IO_BUFFER_SIZE) as f:
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+def url_fingerprint(url: str) -> int:
+    """URL的64位指纹
+
+    整个爬取周期常驻内存的已知URL集合用指纹代替完整字符串，
+    每条固定8字节且比较无需逐字符；优先xxhash，回退md5截断。
+    """
+    encoded = url.encode('utf-8')
+    if _HAS_XXHASH:
+        return xxhash.xxh3_64_intdigest(encoded)
+    return int.from_bytes(hashlib.md5(encoded).digest()[:8], 'little')
+
+
+# 摘要需要的顶层字段；写入顺序保证它们位于items数组之前
+_SUMMARY_KEYS = ('url', 'source_key', 'source_name', 'last_updated', 'total_count')
+
+
+def _read_summary_fields(filepath: str) -> Dict:
+    """只读取数据文件的摘要字段
+
+    安装ijson时流式解析，碰到items数组就停——大文件的条目列表
+    不会被读入内存；否则退回整文件解析。
+    """
+    if _HAS_IJSON:
+        fields = {}
+        with open(filepath, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+            for prefix, event, value in ijson.parse(f):
+                if prefix == 'items':
+                    break
+                if prefix in _SUMMARY_KEYS and event in ('string', 'number', 'null'):
+                    fields[prefix] = value
+        return fields
+
+    with open(filepath, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+        return _json_loads(f.read())
+
 
 class DataStorage:
     """数据存储和增量更新管理"""
 
     def __init__(self, data_dir: str = "data"):
         self.data_dir = data_dir
+        # 多个配置可能并发保存，串行化写入
+        self._lock = threading.Lock()
+        # 各数据源URL索引的进程内缓存：索引文件路径 -> (mtime_ns, URL集合)；
+        # mtime不一致说明文件被其他进程改过，照常重新加载
+        self._url_index_cache: Dict[str, Tuple[int, set]] = {}
         self.ensure_data_dir()
 
     def ensure_data_dir(self):
@@ -21,116 +211,284 @@ class DataStorage:
     def _get_file_name(self, url: str, source_name: str = None) -> str:
         """生成文件名，优先使用source_name，否则使用URL哈希"""
         if source_name:
-            # 清理文件名，移除特殊字符
-            import re
-            clean_name = re.sub(r'[^\w\u4e00-\u9fff\-_]', '_', source_name)
-            return clean_name
-        else:
-            # 兼容旧版本，使用URL哈希
-            return hashlib.md5(url.encode('utf-8')).hexdigest()
+            return _sanitized_name(source_name)
+        return _url_hash_name(self.data_dir, url)
 
-    def _get_data_file(self, url: str, source_name: str = None) -> str:
-        """获取数据文件路径"""
+    def _get_items_file(self, url: str, source_name: str = None) -> str:
+        """获取条目文件路径（追加式JSONL，一行一条）"""
+        file_name = self._get_file_name(url, source_name)
+        return os.path.join(self.data_dir, f"{file_name}.items.jsonl")
+
+    def _get_meta_file(self, url: str, source_name: str = None) -> str:
+        """获取元数据文件路径（只存计数等摘要字段，体积恒定）"""
+        file_name = self._get_file_name(url, source_name)
+        return os.path.join(self.data_dir, f"{file_name}.meta.json")
+
+    def _get_legacy_data_file(self, url: str, source_name: str = None) -> str:
+        """旧版整体重写的数据文件路径（仅用于读取兼容）"""
         file_name = self._get_file_name(url, source_name)
         return os.path.join(self.data_dir, f"{file_name}.json")
 
     def _get_history_file(self, url: str, source_name: str = None) -> str:
-        """获取历史记录文件路径"""
+        """获取历史记录文件路径（追加式JSONL日志）"""
+        file_name = self._get_file_name(url, source_name)
+        return os.path.join(self.data_dir, f"{file_name}_history.jsonl")
+
+    def _get_legacy_history_file(self, url: str, source_name: str = None) -> str:
+        """旧版整体重写的历史文件路径（仅用于读取兼容）"""
         file_name = self._get_file_name(url, source_name)
         return os.path.join(self.data_dir, f"{file_name}_history.json")
 
-    def load_existing_data(self, url: str, source_name: str = None) -> Dict:
-        """加载已存在的数据"""
-        data_file = self._get_data_file(url, source_name)
-        if os.path.exists(data_file):
+    def _get_index_file(self, url: str, source_name: str = None) -> str:
+        """获取URL索引文件路径（只存已入库的URL列表）"""
+        file_name = self._get_file_name(url, source_name)
+        return os.path.join(self.data_dir, f"{file_name}.urls.json")
+
+    def _load_url_index(self, url: str, source_name: str = None) -> set:
+        """加载URL索引；索引缺失时从完整数据文件重建（兼容旧数据）"""
+        index_file = self._get_index_file(url, source_name)
+        if os.path.exists(index_file):
             try:
-                with open(data_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+                mtime_ns = os.stat(index_file).st_mtime_ns
+                cached = self._url_index_cache.get(index_file)
+                if cached is not None and cached[0] == mtime_ns:
+                    return cached[1]
+                with open(index_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                    url_index = set(_json_loads(f.read()))
+                self._url_index_cache[index_file] = (mtime_ns, url_index)
+                return url_index
             except Exception as e:
-                logging.error(f"加载数据文件失败: {e}")
+                logging.error(f"加载URL索引失败: {e}")
+
+        return {item['url'] for item in self._iter_items(url, source_name)}
+
+    def _save_url_index(self, url: str, url_index: set, source_name: str = None):
+        """保存URL索引"""
+        index_file = self._get_index_file(url, source_name)
+        _atomic_write(index_file, _json_dumps(sorted(url_index)))
+        # 写入后登记缓存，下次保存直接用内存里的集合，不再读文件
+        self._url_index_cache[index_file] = (os.stat(index_file).st_mtime_ns, url_index)
+
+    def _load_meta(self, url: str, source_name: str = None) -> Dict:
+        """加载元数据；无meta文件时回退读旧版数据文件的摘要字段"""
+        meta_file = self._get_meta_file(url, source_name)
+        if os.path.exists(meta_file):
+            try:
+                # 调用方只读不改，直接共享缓存的解析结果
+                return _load_json_cached(meta_file)
+            except Exception as e:
+                logging.error(f"加载元数据文件失败: {e}")
                 return {}
+
+        legacy_file = self._get_legacy_data_file(url, source_name)
+        if os.path.exists(legacy_file):
+            try:
+                return _read_summary_fields(legacy_file)
+            except Exception as e:
+                logging.error(f"加载数据文件失败: {e}")
         return {}
 
-    def save_data(self, url: str, results: List[Dict[str, str]], source_key: str = None, source_name: str = None) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
+    def _iter_items(self, url: str, source_name: str = None):
+        """逐条产出已存储的条目
+
+        优先流式读取JSONL条目文件；无条目文件时回退到旧版整体
+        JSON数据文件（一次性解析其items数组）。
+        """
+        items_file = self._get_items_file(url, source_name)
+        if os.path.exists(items_file):
+            try:
+                with open(items_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            yield _json_loads(line)
+            except Exception as e:
+                logging.error(f"加载条目文件失败: {e}")
+            return
+
+        legacy_file = self._get_legacy_data_file(url, source_name)
+        if os.path.exists(legacy_file):
+            try:
+                with open(legacy_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                    if _HAS_IJSON:
+                        # 逐条流式产出items数组，不整体加载旧文件
+                        yield from ijson.items(f, 'items.item')
+                    else:
+                        yield from _json_loads(f.read()).get('items', [])
+            except Exception as e:
+                logging.error(f"加载数据文件失败: {e}")
+
+    def load_existing_data(self, url: str, source_name: str = None) -> Dict:
+        """加载已存在的数据（元数据加全部条目，兼容旧返回结构）"""
+        meta = self._load_meta(url, source_name)
+        if not meta:
+            return {}
+        data = dict(meta)
+        data['items'] = list(self._iter_items(url, source_name))
+        return data
+
+    def get_known_urls(self, url: str, source_name: str = None) -> set:
+        """获取某数据源已存储URL的指纹集合，供增量爬取提前停止翻页
+
+        返回64位指纹而非完整字符串，大历史下内存占用约为原来的1/8。
+        指纹只用于提前停止翻页的启发式判断；入库去重仍比较完整URL
+        （_save_data_locked），哈希碰撞最多导致少翻几页，不会丢数据。
+        """
+        # 索引集合可能被并发的保存原地更新，持锁期间完成快照
+        with self._lock:
+            return {url_fingerprint(u) for u in self._load_url_index(url, source_name)}
+
+    def save_data(self, url: str, results: List[Dict[str, str]], source_key: str = None, source_name: str = None) -> Tuple[int, List[Dict[str, str]]]:
         """
         保存数据并返回新增的结果
-        返回: (所有结果, 新增结果)
+        返回: (总条目数, 新增结果)
         """
-        existing_data = self.load_existing_data(url, source_name)
-        existing_items = existing_data.get('items', [])
+        with self._lock:
+            return self._save_data_locked(url, results, source_key, source_name)
+
+    def _migrate_legacy_data(self, url: str, source_name: str = None) -> int:
+        """把旧版整体JSON数据文件的条目搬入JSONL条目文件，返回条目数
 
-        # 创建已存在项目的集合（基于URL去重）
-        existing_urls = {item['url'] for item in existing_items}
+        只在条目文件尚不存在时发生一次；旧文件保留原样，之后的
+        读取都走新格式。
+        """
+        legacy_file = self._get_legacy_data_file(url, source_name)
+        if not os.path.exists(legacy_file):
+            return 0
+
+        try:
+            with open(legacy_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                legacy_items = _json_loads(f.read()).get('items', [])
+        except Exception as e:
+            logging.error(f"加载数据文件失败: {e}")
+            return 0
+
+        count = len(legacy_items)
+        items_file = self._get_items_file(url, source_name)
+        with open(items_file, 'ab', buffering=_IO_BUFFER_SIZE) as f:
+            f.writelines(_json_dumps(item) + b'\n' for item in legacy_items)
+        logging.info("已迁移旧版数据文件: %s (%d 项)", os.path.basename(legacy_file), count)
+        return count
+
+    def _save_data_locked(self, url: str, results: List[Dict[str, str]], source_key: str = None, source_name: str = None) -> Tuple[int, List[Dict[str, str]]]:
+        # 用URL索引判断新增项，避免每次保存都扫描全部历史条目
+        url_index = self._load_url_index(url, source_name)
 
         # 找出新增的项目
-        new_items = [item for item in results if item['url'] not in existing_urls]
+        new_items = _filter_new_items(results, url_index)
+
+        # 确定当前总数：meta里有就直接用，否则迁移旧数据时顺带统计
+        meta = self._load_meta(url, source_name)
+        items_file = self._get_items_file(url, source_name)
+        if not os.path.exists(items_file):
+            existing_count = self._migrate_legacy_data(url, source_name)
+        else:
+            existing_count = meta.get('total_count', 0)
+        total_count = existing_count + len(new_items)
+
+        url_index.update(item['url'] for item in new_items)
+        self._persist(url, new_items, total_count, url_index, source_key, source_name)
+
+        logging.info("保存数据完成: 总计 %d 项，新增 %d 项", total_count, len(new_items))
+        return total_count, new_items
 
-        # 合并所有项目（去重）
-        all_items = existing_items + new_items
+    def _persist(self, url: str, new_items: List[Dict[str, str]], total_count: int,
+                 url_index: set, source_key: str = None, source_name: str = None):
+        """一次保存的全部落盘动作：条目追加、元数据、URL索引、历史
 
-        # 保存更新后的数据
-        updated_data = {
+        集中在一个函数里顺序写出，每个文件只打开一次，单次保存的
+        系统调用数固定且与历史总量无关。
+
+        轮询常态是毫无新增：此时只重写几十字节的元数据文件刷新
+        last_updated，条目、索引、历史文件一概不碰。
+        """
+        # 本次保存统一使用一个时间戳，数据与历史记录保持一致
+        now_iso = datetime.now().isoformat()
+
+        # 只追加新增条目，写入量与增量成正比而非与历史总量成正比
+        if new_items:
+            items_file = self._get_items_file(url, source_name)
+            with open(items_file, 'ab', buffering=_IO_BUFFER_SIZE) as f:
+                f.writelines(_json_dumps(item) + b'\n' for item in new_items)
+
+        # 元数据文件很小，整体重写代价可忽略
+        meta_file = self._get_meta_file(url, source_name)
+        _atomic_write(meta_file, _json_dumps({
             'url': url,
             'source_key': source_key,
             'source_name': source_name,
-            'last_updated': datetime.now().isoformat(),
-            'total_count': len(all_items),
-            'items': all_items
-        }
-
-        data_file = self._get_data_file(url, source_name)
-        with open(data_file, 'w', encoding='utf-8') as f:
-            json.dump(updated_data, f, ensure_ascii=False, indent=2)
-
-        # 记录历史
-        self._save_history(url, new_items, source_key, source_name)
+            'last_updated': now_iso,
+            'total_count': total_count
+        }))
 
-        logging.info(f"保存数据完成: 总计 {len(all_items)} 项，新增 {len(new_items)} 项")
-        return all_items, new_items
+        if new_items:
+            self._save_url_index(url, url_index, source_name)
+            self._save_history(url, new_items, source_key, source_name, now_iso)
 
-    def _save_history(self, url: str, new_items: List[Dict[str, str]], source_key: str = None, source_name: str = None):
+    def _save_history(self, url: str, new_items: List[Dict[str, str]], source_key: str = None, source_name: str = None, now_iso: str = None):
         """保存历史记录"""
         if not new_items:
             return
 
         history_file = self._get_history_file(url, source_name)
         history_entry = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': now_iso or datetime.now().isoformat(),
             'source_key': source_key,
             'source_name': source_name,
             'new_items_count': len(new_items),
             'new_items': new_items
         }
 
-        history = []
+        # 追加一行即可，无需读取并整体重写历史文件
+        with open(history_file, 'ab', buffering=1 << 16) as f:
+            f.write(_json_dumps(history_entry) + b'\n')
+
+        self._maybe_compact_history(history_file)
+
+    def _maybe_compact_history(self, history_file: str, max_lines: int = 200,
+                               keep: int = 50):
+        """历史日志行数超限时重写一次，只保留最近keep条"""
+        try:
+            with open(history_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                lines = f.readlines()
+        except OSError:
+            return
+
+        if len(lines) <= max_lines:
+            return
+
+        _atomic_write(history_file, b''.join(lines[-keep:]))
+
+    def _read_history(self, url: str, source_name: str = None,
+                      limit: int = 50) -> List[Dict]:
+        """读取最近limit条历史记录，截断在读取时惰性完成"""
+        history_file = self._get_history_file(url, source_name)
         if os.path.exists(history_file):
+            entries = deque(maxlen=limit)
             try:
-                with open(history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
+                with open(history_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                    for line in f:
+                        line = line.strip()
+                        if line:
+                            entries.append(_json_loads(line))
             except Exception as e:
                 logging.error(f"加载历史文件失败: {e}")
+            return list(entries)
 
-        history.append(history_entry)
-
-        # 只保留最近50次记录
-        if len(history) > 50:
-            history = history[-50:]
-
-        with open(history_file, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        # 兼容旧版整体JSON历史文件
+        legacy_file = self._get_legacy_history_file(url, source_name)
+        if os.path.exists(legacy_file):
+            try:
+                with open(legacy_file, 'rb', buffering=_IO_BUFFER_SIZE) as f:
+                    return _json_loads(f.read())[-limit:]
+            except Exception as e:
+                logging.error(f"加载历史文件失败: {e}")
+        return []
 
     def get_summary(self, url: str, source_name: str = None) -> Dict:
         """获取数据摘要"""
-        data = self.load_existing_data(url, source_name)
-        history_file = self._get_history_file(url, source_name)
-
-        history = []
-        if os.path.exists(history_file):
-            try:
-                with open(history_file, 'r', encoding='utf-8') as f:
-                    history = json.load(f)
-            except Exception:
-                pass
+        data = self._load_meta(url, source_name)
+        history = self._read_history(url, source_name)
 
         return {
             'url': url,
@@ -143,44 +501,69 @@ class DataStorage:
         }
 
     def export_to_csv(self, url: str, output_file: str):
-        """导出数据到CSV文件"""
+        """导出数据到CSV文件（逐条流式写出，不整体加载条目列表）"""
         import csv
-        data = self.load_existing_data(url)
-        items = data.get('items', [])
+        count = 0
+
+        def rows():
+            # 解析一条写一条，峰值内存与数据量无关
+            nonlocal count
+            for item in self._iter_items(url):
+                count += 1
+                yield (item['title'], item['url'], item.get('discovered_at', ''))
 
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
+        with open(output_file, 'w', newline='', encoding='utf-8', buffering=_IO_BUFFER_SIZE) as csvfile:
             writer = csv.writer(csvfile)
             writer.writerow(['标题', '链接地址', '发现时间'])
-
-            for item in items:
-                writer.writerow([
-                    item['title'],
-                    item['url'],
-                    item.get('discovered_at', '')
-                ])
-
-        logging.info(f"已导出 {len(items)} 条记录到 {output_file}")
+            writer.writerows(rows())
+
+        logging.info(f"已导出 {count} 条记录到 {output_file}")
+
+    def _parse_summary(self, filepath: str) -> Dict:
+        """解析单个数据文件的摘要字段，失败时返回None"""
+        try:
+            if filepath.endswith('.meta.json'):
+                data = _load_json_cached(filepath)
+            else:
+                data = _read_summary_fields(filepath)
+            return {
+                'url': data.get('url', 'Unknown'),
+                'source_key': data.get('source_key'),
+                'source_name': data.get('source_name'),
+                'total_items': data.get('total_count', 0),
+                'last_updated': data.get('last_updated', 'Never')
+            }
+        except Exception as e:
+            logging.error(f"读取文件 {os.path.basename(filepath)} 失败: {e}")
+            return None
 
     def get_all_summaries(self) -> List[Dict]:
-        """获取所有数据源的摘要"""
-        summaries = []
+        """获取所有数据源的摘要
+
+        各文件相互独立，用线程池并行读取和解析。
+        """
         if not os.path.exists(self.data_dir):
-            return summaries
-
-        for filename in os.listdir(self.data_dir):
-            if filename.endswith('.json') and not filename.endswith('_history.json'):
-                try:
-                    filepath = os.path.join(self.data_dir, filename)
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        summaries.append({
-                            'url': data.get('url', 'Unknown'),
-                            'source_key': data.get('source_key'),
-                            'source_name': data.get('source_name'),
-                            'total_items': data.get('total_count', 0),
-                            'last_updated': data.get('last_updated', 'Never')
-                        })
-                except Exception as e:
-                    logging.error(f"读取文件 {filename} 失败: {e}")
-
-        return summaries
\ No newline at end of file
+            return []
+
+        # scandir的DirEntry自带目录读出的类型信息，无需逐文件stat
+        with os.scandir(self.data_dir) as it:
+            entries = [entry for entry in it if entry.is_file()]
+
+        filenames = {entry.name for entry in entries}
+        filepaths = []
+        for entry in entries:
+            if entry.name.endswith('.meta.json'):
+                filepaths.append(entry.path)
+            elif (entry.name.endswith('.json')
+                    and not entry.name.endswith('_history.json')
+                    and not entry.name.endswith('.urls.json')):
+                # 旧版数据文件；已迁移（存在同名meta）时以meta为准
+                if entry.name[:-len('.json')] + '.meta.json' not in filenames:
+                    filepaths.append(entry.path)
+        if not filepaths:
+            return []
+
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [summary for summary in executor.map(self._parse_summary, filepaths)
+                    if summary is not None]
\ No newline at end of file